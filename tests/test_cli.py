@@ -0,0 +1,121 @@
+#  SPDX-FileCopyrightText: 2026 Siemens AG
+#  SPDX-License-Identifier: MIT
+
+import re
+
+import requests_mock as rm
+from click.testing import CliRunner
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.bom import Component as BomComponent
+from packageurl import PackageURL
+
+from vilocify.cli import LOOKUP_WORKERS, _find_component_requests, _find_vilocify_components, _match_bom, cli
+
+CONTENT_TYPE = {"Content-Type": "application/vnd.api+json"}
+COMPONENTS_URL = re.compile(r"https://portal\.vilocify\.com/api/v2/components\?")
+
+
+def _page(*items: dict) -> dict:
+    return {"data": list(items), "links": {"next": None}}
+
+
+def _resource(jsonapi_type: str, resource_id: str, **attributes: str) -> dict:
+    return {"type": jsonapi_type, "id": resource_id, "attributes": attributes}
+
+
+def _bom(*purls: str) -> Bom:
+    return Bom(components=[BomComponent(name=purl, purl=PackageURL.from_string(purl)) for purl in purls])
+
+
+def test_batched_component_request_lookup_keeps_first_hit(requests_mock: rm.Mocker):
+    requests_mock.get(
+        "https://portal.vilocify.com/api/v2/componentRequests",
+        headers=CONTENT_TYPE,
+        json=_page(
+            _resource("componentRequests", "cr1", componentUrl="pkg:npm/foo@1.0.0", state="rejected"),
+            _resource("componentRequests", "cr2", componentUrl="pkg:npm/foo@1.0.0", state="mapped"),
+        ),
+    )
+
+    found = _find_component_requests(("pkg:npm/foo@1.0.0", "pkg:npm/bar@1.0.0"))
+
+    assert found["pkg:npm/foo@1.0.0"] is not None
+    assert found["pkg:npm/foo@1.0.0"].id == "cr1"
+    assert found["pkg:npm/bar@1.0.0"] is None
+
+
+def test_batched_component_lookup_keeps_first_hit(requests_mock: rm.Mocker):
+    requests_mock.get(
+        COMPONENTS_URL,
+        headers=CONTENT_TYPE,
+        json=_page(
+            _resource("components", "c1", name="Node.js Package: foo", version="1.0.0"),
+            _resource("components", "c2", name="Node.js Package: foo", version="1.0.0"),
+        ),
+    )
+
+    found = _find_vilocify_components((("Node.js Package: foo", "1.0.0"),))
+
+    assert found[("Node.js Package: foo", "1.0.0")] is not None
+    assert found[("Node.js Package: foo", "1.0.0")].id == "c1"
+
+
+def test_match_bom_looks_up_keys_with_commas_individually(requests_mock: rm.Mocker):
+    requests_mock.get(COMPONENTS_URL, headers=CONTENT_TYPE, json=_page())
+
+    _match_bom({}, _bom("pkg:npm/foo@1.0.0", "pkg:npm/bar@1,2"))
+
+    batched = [r for r in requests_mock.request_history if "filter[name][in]" in r.qs]
+    assert len(batched) == 1
+    assert batched[0].qs["filter[name][in]"] == ["node.js package: foo"]
+
+    single = [r.qs["filter[version][eq]"] for r in requests_mock.request_history if "filter[name][eq]" in r.qs]
+    assert single == [["1,2"]]
+
+
+def test_match_bom_falls_back_to_single_lookups_on_bad_request(requests_mock: rm.Mocker):
+    def components(request: rm.request._RequestObjectProxy, context: rm.response._Context) -> dict:
+        if "filter[name][in]" in request.qs:
+            context.status_code = 400
+            return {"errors": [{"title": "Invalid filter"}]}
+        return _page(_resource("components", "c1", name="Node.js Package: foo", version="1.0.0"))
+
+    requests_mock.get(COMPONENTS_URL, headers=CONTENT_TYPE, json=components)
+
+    components_found, unidentified = _match_bom({}, _bom("pkg:npm/foo@1.0.0"))
+
+    assert [c.id for c in components_found] == ["c1"]
+    assert unidentified == []
+    assert [r.qs.get("filter[name][eq]") for r in requests_mock.request_history] == [
+        None,
+        ["node.js package: foo"],
+    ]
+
+
+def test_notifications_are_printed_in_order(requests_mock: rm.Mocker):
+    ids = [str(i) for i in range(2 * LOOKUP_WORKERS + 1)]
+    requests_mock.get(
+        "https://portal.vilocify.com/api/v2/notifications",
+        headers=CONTENT_TYPE,
+        json=_page(*(_resource("notifications", i, title=f"Notification {i}", description="") for i in ids)),
+    )
+    requests_mock.get(
+        re.compile(r"https://portal\.vilocify\.com/api/v2/notifications/\d+/relationships/vulnerabilities"),
+        headers=CONTENT_TYPE,
+        json=_page(),
+    )
+
+    result = CliRunner().invoke(cli, ["notifications", "--for", "ml1"])
+
+    assert result.exit_code == 0
+    titles = [line for line in result.output.splitlines() if line.startswith("Title: ")]
+    assert titles == [f"Title: Notification {i}" for i in ids]
+
+
+def test_notifications_without_results(requests_mock: rm.Mocker):
+    requests_mock.get("https://portal.vilocify.com/api/v2/notifications", headers=CONTENT_TYPE, json=_page())
+
+    result = CliRunner().invoke(cli, ["notifications", "--for", "ml1", "--since", "2026-01-01"])
+
+    assert result.exit_code == 0
+    assert result.output == "No new notifications for monitoringlist #ml1 since 2026-01-01T00:00:00.\n"
@@ -2,9 +2,11 @@
 #  SPDX-License-Identifier: MIT
 
 import pytest
+import requests
 import requests_mock as rm
+from requests.adapters import HTTPAdapter
 
-from vilocify import http
+from vilocify import api_config, http
 from vilocify.http import JSONAPIError, JSONAPIRequestError, RequestError
 
 CONTENT_TYPE = {
@@ -22,6 +24,23 @@ def test_invalid_content_type(requests_mock: rm.Mocker):
     assert e.value.message == "Unsupported content type in server response."
 
 
+@pytest.mark.parametrize(
+    "content_type",
+    ["application/vnd.api+json", "Application/VND.API+JSON; charset=utf-8", CONTENT_TYPE["Content-Type"]],
+)
+def test_valid_content_type(requests_mock: rm.Mocker, content_type: str):
+    url = "https://portal.vilocify.com/api/v2/componentRequests"
+    requests_mock.get(url, headers={"Content-Type": content_type}, json={"data": []})
+    assert http.get(url) == {"data": []}
+
+
+def test_similar_content_type_is_rejected(requests_mock: rm.Mocker):
+    url = "https://portal.vilocify.com/api/v2/componentRequests"
+    requests_mock.get(url, headers={"Content-Type": "application/vnd.api+jsonp"}, json={"data": []})
+    with pytest.raises(RequestError):
+        http.get(url)
+
+
 def test_unauthorized_error(requests_mock: rm.Mocker):
     url = "https://portal.vilocify.com/api/v2/componentRequests"
     requests_mock.get(
@@ -46,6 +65,7 @@ def test_unauthorized_error(requests_mock: rm.Mocker):
     with pytest.raises(JSONAPIRequestError) as e:
         http.get(url)
 
+    assert e.value.message == "Encountered errors: 'Unauthorized - Missing Session or API Token'"
     assert len(e.value.errors) == 1
     assert e.value.errors[0] == JSONAPIError(
         title="Unauthorized - Missing Session or API Token",
@@ -86,3 +106,77 @@ def test_unknown_500_response_without_body_and_header(requests_mock: rm.Mocker):
         http.get(url)
 
     assert e.value.message == "Encountered unknown error. No error details were provided from the server."
+
+
+def test_authorization_header_follows_token(requests_mock: rm.Mocker):
+    url = "https://portal.vilocify.com/api/v2/componentRequests"
+    requests_mock.get(url, headers=CONTENT_TYPE, json={"data": []})
+
+    api_config.token = "abc"  # noqa: S105
+    http.get(url)
+    assert requests_mock.request_history[-1].headers["Authorization"] == "Bearer abc"
+
+    api_config.token = "def"  # noqa: S105
+    http.get(url)
+    assert requests_mock.request_history[-1].headers["Authorization"] == "Bearer def"
+
+
+def test_token_applies_to_replaced_client(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(api_config, "client", requests.Session())
+    api_config.token = "abc"  # noqa: S105
+    api_config.client = requests.Session()
+    api_config.token = "abc"  # noqa: S105
+    assert api_config.client.headers["Authorization"] == "Bearer abc"
+
+
+def test_conditional_get_uses_cached_response(requests_mock: rm.Mocker, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(api_config, "cache_enabled", True)
+    monkeypatch.setattr(http, "_response_cache", http._ResponseCache())
+    url = "https://portal.vilocify.com/api/v2/componentRequests"
+    requests_mock.get(
+        url,
+        [
+            {"headers": {**CONTENT_TYPE, "ETag": '"v1"'}, "json": {"data": []}},
+            {"status_code": 304, "headers": {"ETag": '"v1"'}},
+        ],
+    )
+
+    first = http.get(url, params={"page[size]": "1"})
+    assert "If-None-Match" not in requests_mock.request_history[-1].headers
+    assert first == {"data": []}
+    first["data"].append("modified by caller")  # type: ignore[union-attr,index]
+
+    assert http.get(url, params={"page[size]": "1"}) == {"data": []}
+    assert requests_mock.request_history[-1].headers["If-None-Match"] == '"v1"'
+
+
+def test_conditional_get_cache_evicts_least_recently_used(requests_mock: rm.Mocker, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(api_config, "cache_enabled", True)
+    monkeypatch.setattr(api_config, "cache_size", 1)
+    monkeypatch.setattr(http, "_response_cache", http._ResponseCache())
+    url = "https://portal.vilocify.com/api/v2/componentRequests"
+    requests_mock.get(url, headers={**CONTENT_TYPE, "ETag": '"v1"'}, json={"data": []})
+
+    http.get(url, params={"page[size]": "1"})
+    http.get(url, params={"page[size]": "2"})
+    http.get(url, params={"page[size]": "1"})
+    assert "If-None-Match" not in requests_mock.request_history[-1].headers
+
+
+def test_base_url_is_validated_and_updates_api_host(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(api_config, "base_url", "https://vilocify.example.com/api/v2/")
+    assert api_config.base_url == "https://vilocify.example.com/api/v2"
+    assert api_config.api_host == "https://vilocify.example.com"
+
+    with pytest.raises(ValueError, match="Bad schema"):
+        api_config.base_url = "ftp://vilocify.example.com/api/v2"
+
+
+def test_pool_maxsize_applies_to_existing_session(monkeypatch: pytest.MonkeyPatch):
+    pool_maxsize = 64
+    session = api_config.client
+    monkeypatch.setattr(api_config, "pool_maxsize", pool_maxsize)
+
+    adapter = session.get_adapter("https://portal.vilocify.com")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == pool_maxsize
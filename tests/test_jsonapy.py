@@ -4,14 +4,18 @@
 import os
 
 import pytest
+import requests_mock as rm
 
 from vilocify import api_config
 from vilocify.jsonapy import (
+    Action,
     Attribute,
+    DeserializationError,
     IllegalSortError,
     Model,
     RelationshipToMany,
     RelationshipToOne,
+    Serializer,
     UnmappedModelError,
 )
 
@@ -63,7 +67,7 @@ def test_default_model_eq():
 
     assert Test(a1=1, a2=2) == Test(a1=1, a2=2)
     assert Test(a1=1, a2=1) != Test(a1=1, a2=2)
-    # assert Test(a1=1) != Test(a1=1, a2=2)
+    assert Test(a1=1) != Test(a1=1, a2=2)
 
 
 def test_default_model_eq_ignores_relationships():
@@ -78,6 +82,40 @@ def test_default_model_eq_ignores_relationships():
     assert t1 == t2
 
 
+def test_serialize_one_respects_serialize_on():
+    class Test(Model):
+        a1 = Attribute[int]("a1")
+        a2 = Attribute[int]("a2", serialize_on=(Action.CREATE,))
+        a3 = Attribute[int]("a3", serialize_on=())
+        a4 = Attribute[int]("a4")
+
+    t = Test(id="1", a1=1, a2=2)
+    t._jsonapi_attributes["a3"] = 3
+
+    assert Serializer.serialize_one(t, None, Action.CREATE) == {
+        "data": {"type": "tests", "id": "1", "attributes": {"a1": 1, "a2": 2}}
+    }
+    assert Serializer.serialize_one(t, None, Action.UPDATE) == {
+        "data": {"type": "tests", "id": "1", "attributes": {"a1": 1}}
+    }
+
+
+def test_serialize_one_includes_attribute_subclasses_and_skips_private_names():
+    class CustomAttribute(Attribute[int]):
+        pass
+
+    class Test(Model):
+        a1 = CustomAttribute("a1")
+        _a2 = Attribute[int]("a2")
+
+    t = Test(id="1")
+    t._jsonapi_attributes.update(a1=1, a2=2)
+
+    assert Serializer.serialize_one(t, None, Action.UPDATE) == {
+        "data": {"type": "tests", "id": "1", "attributes": {"a1": 1}}
+    }
+
+
 def test_unmapped_model_delete_raises():
     class Test(Model):
         a1 = Attribute("a1")
@@ -139,3 +177,105 @@ def test_illegal_sort():
     t = Test.asc("a1")
     with pytest.raises(IllegalSortError):
         t.desc("a1")
+
+
+def test_first_requests_single_item_page(requests_mock: rm.Mocker):
+    class Test(Model):
+        a1 = Attribute[int]("a1")
+
+    requests_mock.get(
+        "https://portal.vilocify.com/api/v2/tests",
+        headers={"Content-Type": "application/vnd.api+json"},
+        json={"data": [{"type": "tests", "id": "1", "attributes": {"a1": 1}}], "links": {"next": None}},
+    )
+
+    assert Test.where("a1", "eq", "1").first() == Test(id="1", a1=1)
+    assert requests_mock.request_history[0].qs["page[size]"] == ["1"]
+
+    assert Test.firstn(5) == [Test(id="1", a1=1)]
+    assert requests_mock.request_history[1].qs["page[size]"] == ["5"]
+
+
+def test_iteration_follows_next_links(requests_mock: rm.Mocker):
+    class Test(Model):
+        a1 = Attribute[int]("a1")
+
+    headers = {"Content-Type": "application/vnd.api+json"}
+    requests_mock.get(
+        "https://portal.vilocify.com/api/v2/tests?page[size]=100",
+        headers=headers,
+        json={
+            "data": [{"type": "tests", "id": "1", "attributes": {"a1": 1}}],
+            "links": {"next": "/api/v2/tests?page[after]=1"},
+        },
+    )
+    requests_mock.get(
+        "https://portal.vilocify.com/api/v2/tests?page[after]=1",
+        headers=headers,
+        json={"data": [{"type": "tests", "id": "2", "attributes": {"a1": 2}}], "links": {"next": None}},
+    )
+
+    assert list(Test.iter()) == [Test(id="1", a1=1), Test(id="2", a1=2)]
+
+
+def test_pick_requests_only_picked_fields(requests_mock: rm.Mocker):
+    class Test(Model):
+        a1 = Attribute[int]("a1")
+        a2 = Attribute[int]("attributeTwo")
+
+    requests_mock.get(
+        "https://portal.vilocify.com/api/v2/tests",
+        headers={"Content-Type": "application/vnd.api+json"},
+        json={"data": [{"type": "tests", "id": "1", "attributes": {"attributeTwo": 2}}], "links": {"next": None}},
+    )
+
+    assert Test.where("a1", "eq", "1").pick("id", "a2") == [("1", 2)]
+    assert requests_mock.request_history[-1].qs["fields[tests]"] == ["attributetwo"]
+
+    assert Test.where("a1", "eq", "1").ids() == ["1"]
+    assert requests_mock.request_history[-1].qs["fields[tests]"] == [""]
+
+
+def test_iterating_to_many_relationship_takes_attributes_from_included(requests_mock: rm.Mocker):
+    class Item(Model):
+        a1 = Attribute[int]("a1")
+
+    class Test(Model):
+        items = RelationshipToMany(Item)
+
+    requests_mock.get(
+        "https://portal.vilocify.com/api/v2/tests/1/relationships/items",
+        headers={"Content-Type": "application/vnd.api+json"},
+        json={
+            "data": [{"type": "items", "id": "2"}, {"type": "items", "id": "3"}],
+            "included": [
+                {"type": "items", "id": "3", "attributes": {"a1": 3}},
+                {"type": "items", "id": "2", "attributes": {"a1": 2}},
+            ],
+            "links": {"next": None},
+        },
+    )
+
+    assert list(Test(id="1").items) == [Item(id="2", a1=2), Item(id="3", a1=3)]
+    assert requests_mock.request_history[0].qs["include"] == ["items"]
+
+
+def test_iterating_to_many_relationship_rejects_mismatched_included(requests_mock: rm.Mocker):
+    class Item(Model):
+        a1 = Attribute[int]("a1")
+
+    class Test(Model):
+        items = RelationshipToMany(Item)
+
+    requests_mock.get(
+        "https://portal.vilocify.com/api/v2/tests/1/relationships/items",
+        headers={"Content-Type": "application/vnd.api+json"},
+        json={
+            "data": [{"type": "items", "id": "2"}],
+            "included": [{"type": "items", "id": "2", "attributes": []}],
+            "links": {"next": None},
+        },
+    )
+
+    with pytest.raises(DeserializationError, match="Included document has wrong type or id"):
+        list(Test(id="1").items)
@@ -10,6 +10,7 @@ distro_purls = [
     ("pkg:deb/debian/base-files@12.4%2Bdeb12u10?arch=amd64&distro=debian-12", "Debian 12 Package: base-files"),
     ("pkg:deb/debian/openssl@1.1.1f?distro=ubuntu-20.04", "Debian Package: openssl"),
     ("pkg:deb/debian/bash@4.12", "Debian Package: bash"),
+    ("pkg:DEB/Debian/bash@5.2?distro=Debian-12", "Debian 12 Package: bash"),
     ("pkg:apk/alpine/musl", "Alpine Package: musl"),
     ("pkg:apk/alpine/musl@1.2.5-r9?distro=alpine-3.21.3", "Alpine 3.21 Package: musl"),
     (
@@ -6,7 +6,7 @@ from typing import assert_type
 import pytest
 import requests_mock as rm
 
-from vilocify.models import Component, ComponentRequest, Membership, MonitoringList
+from vilocify.models import Component, ComponentRequest, Membership, MonitoringList, Vulnerability
 
 
 def test_membership() -> None:
@@ -42,3 +42,28 @@ def test_monitoring_list_component_deletion(requests_mock: rm.Mocker) -> None:
     ml.components.delete(Component(id="1337"))
 
     assert requests_mock.call_count == 1
+
+
+def test_monitoring_list_component_ids(requests_mock: rm.Mocker) -> None:
+    ml_id = "c95b8d2a-d113-41e8-8b8a-909aabbe5ff5"
+    requests_mock.get(
+        f"https://portal.vilocify.com/api/v2/monitoringLists/{ml_id}/relationships/components",
+        headers={"Content-Type": "application/vnd.api+json"},
+        json={"data": [{"type": "components", "id": "1337"}], "links": {"next": None}},
+    )
+
+    assert MonitoringList(id=ml_id).components.ids() == ["1337"]
+    assert "include" not in requests_mock.request_history[-1].qs
+
+
+def test_models_have_no_instance_dict() -> None:
+    c = Component(name="openssl")
+    assert not hasattr(c, "__dict__")
+    with pytest.raises(AttributeError):
+        c.unknown = "value"  # type: ignore[attr-defined]
+    assert not hasattr(MonitoringList(id="1").components, "__dict__")
+
+
+def test_jsonapi_type_names() -> None:
+    assert MonitoringList._jsonapi_type_name == MonitoringList.jsonapi_type_name() == "monitoringLists"
+    assert Vulnerability._jsonapi_type_name == Vulnerability.jsonapi_type_name() == "vulnerabilities"
@@ -6,6 +6,8 @@ import os
 from urllib.parse import ParseResult, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 __version__ = importlib.metadata.version("vilocify-sdk")
 
@@ -13,12 +15,21 @@ JSON = dict[str, "JSON"] | list["JSON"] | str | int | float | bool | None
 
 
 class _APIConfig:
-    def __init__(self):
-        self._token = None
+    def __init__(self) -> None:
+        self._token: str | None = None
+        self._client: requests.Session | None = None
         self.base_url = os.environ.get("VILOCIFY_API_BASE_URL", "https://portal.vilocify.com/api/v2")
-        self.api_host = _APIConfig._drop_path(self.base_url)
         self.request_timeout_seconds = 20
+        self._pool_maxsize = 32
+        self.cache_enabled = False
+        self.cache_size = 128
 
+    @staticmethod
+    def _drop_path(url: str) -> str:
+        parts = urlparse(url)
+        return ParseResult(parts.scheme, parts.netloc, "", "", "", "").geturl()
+
+    def _create_session(self) -> requests.Session:
         session = requests.Session()
         session.headers.update(
             {
@@ -28,12 +39,54 @@ class _APIConfig:
                 "User-Agent": f"vilocify-sdk-python/{__version__}",
             }
         )
-        self.client = session
+        self._mount_adapter(session)
+        return session
 
-    @staticmethod
-    def _drop_path(url: str) -> str:
-        parts = urlparse(url)
-        return ParseResult(parts.scheme, parts.netloc, "", "", "", "").geturl()
+    def _mount_adapter(self, session: requests.Session) -> None:
+        # All requests go to a single host. Keep enough connections alive for concurrent callers and retry
+        # idempotent requests on transient gateway errors. Rate limiting (429) is handled in vilocify.http.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self._pool_maxsize,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False),
+        )
+        for prefix in ("https://", "http://"):
+            if (previous := session.adapters.get(prefix)) is not None:
+                previous.close()
+            session.mount(prefix, adapter)
+
+    @property
+    def client(self) -> requests.Session:
+        """The HTTP session, created on first use so that the token is read as late as possible."""
+        if self._client is None:
+            self._client = self._create_session()
+        return self._client
+
+    @client.setter
+    def client(self, value: requests.Session):
+        self._client = value
+
+    @property
+    def pool_maxsize(self) -> int:
+        """The number of connections kept alive for reuse. Changing it remounts the adapter of an existing session."""
+        return self._pool_maxsize
+
+    @pool_maxsize.setter
+    def pool_maxsize(self, value: int):
+        self._pool_maxsize = value
+        if self._client is not None:
+            self._mount_adapter(self._client)
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str):
+        if urlparse(value).scheme not in ["http", "https"]:
+            raise ValueError("Bad schema in base URL")
+        self._base_url = value.rstrip("/")
+        self.api_host = _APIConfig._drop_path(self._base_url)
 
     @property
     def token(self) -> str:
@@ -42,7 +95,8 @@ class _APIConfig:
     @token.setter
     def token(self, value: str):
         self._token = value
-        self.client.headers["Authorization"] = f"Bearer {self._token}"
+        if self._client is not None:
+            self._client.headers["Authorization"] = f"Bearer {self._token}"
 
 
 api_config = _APIConfig()
@@ -5,21 +5,25 @@
 
 import csv
 import io
-import json
 import logging
 import sys
 import textwrap
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from itertools import batched
+from pathlib import Path
 
 import click
+import requests
 from click import BadParameter, UsageError
 from click.exceptions import Exit
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.bom import Component as BomComponent
 
 import vilocify
-from vilocify.http import JSONAPIRequestError, RequestError
-from vilocify.match import MissingPurlError, match_bom_component
+from vilocify.http import JSONAPIRequestError, RequestError, json_loads
+from vilocify.match import Matcher, match_purl
 from vilocify.models import (
     Component,
     ComponentRequest,
@@ -28,7 +32,20 @@ from vilocify.models import (
     Vulnerability,
 )
 
-ComponentCache = dict[tuple[str, str], Component]
+ComponentCache = dict[tuple[str, str], Component | None]
+
+# Component lookups are network-bound. Keep the number of parallel requests moderate to avoid running into the API's
+# rate limit.
+LOOKUP_WORKERS = 8
+
+# Number of values per `in` filter when looking up many components or component requests at once. Bounded to keep
+# request URLs at a reasonable length.
+LOOKUP_BATCH_SIZE = 50
+
+COMPONENT_REQUEST_STATES = ("unprocessed", "rejected", "mapped")
+
+# Component requests in these states are not linked to a Vilocify component (yet).
+UNMAPPED_COMPONENT_REQUEST_STATES = frozenset({"unprocessed", "rejected"})
 
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -68,27 +85,48 @@ def cli(log_level: str):
 )
 def notifications(monitoring_list: str, since: datetime):
     """Print all notifications for the given monitoring list since a certain date."""
-    ns = Notification.where("monitoringLists.id", "any", monitoring_list).where("createdAt", "after", since.isoformat())
-    has_notifications = False
-    for notification in ns:
-        has_notifications = True
-        print()
-        print("---")
-        print("Title:", notification.title)
-        print("Description:")
-        print(textwrap.indent(notification.description, "  "))
-        print("Vulnerabilities:")
-        for vuln in Vulnerability.where("id", "in", notification.vulnerabilities.ids()):
-            print("  - CVE: ", vuln.cve)
-            print("    CVSS: ", vuln.cvss)
-            print("    Description: ", vuln.description)
-
-    if not has_notifications:
-        print(f"No new notifications for monitoringlist #{monitoring_list} since {since.isoformat()}.")
-
-
-def _find_vilocify_component(cache: ComponentCache, bom_component: BomComponent) -> Component | None:
-    vilocify_name, vilocify_version, url = match_bom_component(bom_component)
+    since_iso = since.isoformat()
+    ns = Notification.where("monitoringLists.id", "any", monitoring_list).where("createdAt", "after", since_iso)
+    found_any = False
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        # Executor.map would list all notifications before yielding the first result. Keep a bounded window of
+        # lookups in flight instead, so notifications are printed in order as soon as they are available.
+        pending: deque[Future[tuple[Notification, list[Vulnerability]]]] = deque()
+        for n in ns:
+            pending.append(executor.submit(_with_vulnerabilities, n))
+            if len(pending) > LOOKUP_WORKERS:
+                _print_notification(*pending.popleft().result())
+                found_any = True
+        while pending:
+            _print_notification(*pending.popleft().result())
+            found_any = True
+
+    if not found_any:
+        print(f"No new notifications for monitoringlist #{monitoring_list} since {since_iso}.")
+
+
+def _print_notification(notification: Notification, vulnerabilities: list[Vulnerability]) -> None:
+    lines = [
+        "",
+        "---",
+        f"Title: {notification.title}",
+        "Description:",
+        textwrap.indent(notification.description, "  "),
+        "Vulnerabilities:",
+    ]
+    for vuln in vulnerabilities:
+        lines.append(f"  - CVE:  {vuln.cve}")
+        lines.append(f"    CVSS:  {vuln.cvss}")
+        lines.append(f"    Description:  {vuln.description}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _with_vulnerabilities(notification: Notification) -> tuple[Notification, list[Vulnerability]]:
+    return notification, list(notification.vulnerabilities)
+
+
+def _find_vilocify_component(cache: ComponentCache, matcher: Matcher) -> Component | None:
+    vilocify_name, vilocify_version, url = matcher
     if vilocify_version is None:
         return None
 
@@ -114,13 +152,55 @@ def _find_vilocify_component(cache: ComponentCache, bom_component: BomComponent)
     return None
 
 
+def _find_vilocify_components(keys: tuple[tuple[str, str], ...]) -> ComponentCache:
+    """Look up active components for many (name, version) pairs with a single filtered query.
+
+    The result maps every given key to its component, or to None if there is none. An empty result is returned if the
+    API rejects the query, so that callers fall back to looking up components one by one.
+    """
+    names = sorted({name for name, _ in keys})
+    versions = sorted({version for _, version in keys})
+    query = Component.where("name", "in", names).where("version", "in", versions).where("active", "eq", "true")
+    by_key: dict[tuple[str | None, str | None], Component] = {}
+    try:
+        for c in query:
+            # Keep the first hit, like the single lookup with .first() does
+            by_key.setdefault((c.name, c.version), c)
+    except JSONAPIRequestError as e:
+        if e.error_code != requests.codes.bad_request:
+            raise
+        logger.debug("Batched component lookup rejected: %s", e.message)
+        return {}
+
+    return {k: by_key.get(k) for k in keys}
+
+
+def _find_component_requests(purls: tuple[str, ...]) -> dict[str, ComponentRequest | None]:
+    """Look up existing component requests for many PURLs with a single filtered query.
+
+    Like _find_vilocify_components, the result either covers all given PURLs or is empty.
+    """
+    by_url: dict[str | None, ComponentRequest] = {}
+    try:
+        for cr in ComponentRequest.where("componentUrl", "in", list(purls)):
+            by_url.setdefault(cr.component_url, cr)
+    except JSONAPIRequestError as e:
+        if e.error_code != requests.codes.bad_request:
+            raise
+        logger.debug("Batched component request lookup rejected: %s", e.message)
+        return {}
+
+    return {purl: by_url.get(purl) for purl in purls}
+
+
 def _load_bom(file: io.FileIO) -> Bom:
-    if file.name.endswith(".json"):
-        bom = Bom.from_json(data=json.load(file))  # type: ignore[attr-defined]
-    elif file.name.endswith(".xml"):
-        bom = Bom.from_xml(data=file)  # type: ignore[attr-defined]
-    else:
-        raise BadCycloneDXFileError("The CyclondeDX file must end with .json or .xml.")
+    match Path(file.name).suffix:
+        case ".json":
+            bom = Bom.from_json(data=json_loads(file.read()))  # type: ignore[attr-defined]
+        case ".xml":
+            bom = Bom.from_xml(data=file)  # type: ignore[attr-defined]
+        case _:
+            raise BadCycloneDXFileError("The CyclondeDX file must end with .json or .xml.")
 
     if len(bom.components) > MonitoringList.MAX_COMPONENTS:
         raise BadCycloneDXFileError(
@@ -143,20 +223,48 @@ def _load_ml(name: str, comment: str) -> MonitoringList:
     return ml
 
 
-def _match_bom(cache: ComponentCache, bom: Bom) -> tuple[list[Component], list[BomComponent]]:
-    components = []
-    unidentified_components = []
+def _match_bom(cache: ComponentCache, bom: Bom) -> tuple[list[Component], list[tuple[BomComponent, Matcher]]]:
+    """Find Vilocify components for the BOM components.
+
+    Returns the found components and the unidentified BOM components together with their match result.
+    """
+    matched = []
+    seen_purls = set()
     for bom_component in bom.components:
-        try:
-            c = _find_vilocify_component(cache, bom_component)
-        except MissingPurlError:
+        if bom_component.purl is None:
             logger.warning("Ignoring BOM component %s due to missing PURL", bom_component.name)
+        elif bom_component.purl not in seen_purls:
+            # SBOMs often list the same package several times, e.g. once per dependency path.
+            seen_purls.add(bom_component.purl)
+            matched.append((bom_component, match_purl(bom_component.purl)))
+
+    # Values of `in` filters are comma-separated, so names or versions containing commas are looked up individually.
+    keys = sorted(
+        {
+            k
+            for _, (name, version, _) in matched
+            if name is not None
+            and version is not None
+            and (k := (name, version)) not in cache
+            and "," not in name
+            and "," not in version
+        }
+    )
+
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        for found in executor.map(_find_vilocify_components, batched(keys, LOOKUP_BATCH_SIZE)):
+            cache.update(found)
+
+        lookups = [(bc, matcher, executor.submit(_find_vilocify_component, cache, matcher)) for bc, matcher in matched]
+
+    components = []
+    unidentified_components = []
+    for bom_component, matcher, lookup in lookups:
+        if (c := lookup.result()) is not None:
+            logger.info("Found component %s for %s", c.id, bom_component.purl)
+            components.append(c)
         else:
-            if c is not None:
-                logger.info("Found component %s for %s", c.id, bom_component.purl)
-                components.append(c)
-            else:
-                unidentified_components.append(bom_component)
+            unidentified_components.append((bom_component, matcher))
 
     return components, unidentified_components
 
@@ -209,24 +317,34 @@ def monitoringlist_import(name: str, comment: str, yes: bool, from_cyclonedx: io
     components_cache = {(c.name, c.version): c for c in ml.components}
     components, unidentified_components = _match_bom(components_cache, bom)
 
-    for bom_component in unidentified_components:
-        cr = ComponentRequest.where("componentUrl", "eq", str(bom_component.purl)).first()
+    purls = sorted({str(bom_component.purl) for bom_component, _ in unidentified_components})
+    existing_requests: dict[str, ComponentRequest | None] = {}
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        batches = batched((purl for purl in purls if "," not in purl), LOOKUP_BATCH_SIZE)
+        for found in executor.map(_find_component_requests, batches):
+            existing_requests.update(found)
+
+    for bom_component, (component_name, version, _) in unidentified_components:
+        purl = str(bom_component.purl)
+        if purl in existing_requests:
+            cr = existing_requests[purl]
+        else:
+            cr = ComponentRequest.where("componentUrl", "eq", purl).first()
         if cr is None:
-            component_name, version, _ = match_bom_component(bom_component)
             vcs_qualifier = bom_component.purl.qualifiers.get("vcs_url") if bom_component.purl is not None else None
             cr = ComponentRequest(
                 name=component_name or bom_component.name,
                 version=version or bom_component.version or vcs_qualifier or "All Versions",
-                component_url=str(bom_component.purl),
+                component_url=purl,
                 comment="Auto-created by vilocify-sdk-python",
             )
             component_requests.append(cr)
-            logger.info("Could not find component for %s", bom_component.purl)
+            logger.info("Could not find component for %s", purl)
         elif (c := cr.component) is not None:
-            logger.info("Found component %s for %s through component request %s", c.id, bom_component.purl, cr.id)
+            logger.info("Found component %s for %s through component request %s", c.id, purl, cr.id)
             components.append(c)
-        elif cr.state in ("unprocessed", "rejected"):
-            logger.info("The component request %s for %s is %s", cr.id, bom_component.purl, cr.state)
+        elif cr.state in UNMAPPED_COMPONENT_REQUEST_STATES:
+            logger.info("The component request %s for %s is %s", cr.id, purl, cr.state)
 
     if component_requests:
         logger.info(
@@ -237,9 +355,10 @@ def monitoringlist_import(name: str, comment: str, yes: bool, from_cyclonedx: io
             for cr in component_requests:
                 cr.create()
 
-            ml.component_requests.replace(*component_requests)
+            ml.component_requests = component_requests
 
-    ml.components = components
+    # Different BOM components may resolve to the same Vilocify component.
+    ml.components = list({c.id: c for c in components}.values())
     ml.update()
     logger.info("Finished updating monitoring list %s", ml.id)
 
@@ -247,18 +366,17 @@ def monitoringlist_import(name: str, comment: str, yes: bool, from_cyclonedx: io
 @cli.command()
 @click.option(
     "--state",
-    type=click.Choice(["unprocessed", "rejected", "mapped"]),
+    type=click.Choice(COMPONENT_REQUEST_STATES),
     multiple=True,
-    default=["unprocessed", "rejected", "mapped"],
+    default=COMPONENT_REQUEST_STATES,
     help="Filter component requests by state.",
 )
 def component_request(state: tuple[str]):
     """List component requests by processing state."""
     for cr in ComponentRequest.where("state", "in", list(state)):
-        print("title:", cr.vendor, "-", cr.name, "-", cr.version)
-        print("URL:", cr.component_url)
-        print("state:", cr.state)
-        print()
+        sys.stdout.write(
+            f"title: {cr.vendor} - {cr.name} - {cr.version}\nURL: {cr.component_url}\nstate: {cr.state}\n\n"
+        )
 
 
 def main():
@@ -2,15 +2,39 @@
 #  SPDX-License-Identifier: MIT
 
 import logging
+import re
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import requests
 
 from vilocify import JSON, api_config
 
+try:
+    import orjson
+
+    def json_loads(data: bytes | str) -> JSON:
+        return orjson.loads(data)
+
+    def json_dumps(obj: JSON) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def json_loads(data: bytes | str) -> JSON:
+        return json.loads(data)
+
+    def json_dumps(obj: JSON) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
 logger = logging.getLogger(__name__)
 
+_JSONAPI_MEDIA_TYPE = re.compile(r"application/vnd\.api\+json\s*(?:;|$)", re.IGNORECASE)
+
 
 class RequestError(Exception):
     def __init__(self, error_code: int, message: str):
@@ -22,7 +46,7 @@ class RateLimitError(Exception):
     """Raised for rate limiting."""
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONAPIError:
     title: str = ""
     detail: str = ""
@@ -45,16 +69,61 @@ class JSONAPIRequestError(RequestError):
             errors = [JSONAPIError.from_dict(error) for error in raw_errors if isinstance(error, dict)]
 
         if errors:
-            message = f"Encountered errors: {', '.join(f"'{e.title}'" for e in errors)}"
+            message = "Encountered errors: '" + "', '".join([e.title for e in errors]) + "'"
         else:
             message = "Encountered unknown error. No error details were provided from the server."
         return JSONAPIRequestError(code, message, errors)
 
 
-def _request(verb: str, url: str, json: JSON = None, params: dict[str, str] | None = None) -> JSON:
+@dataclass(slots=True)
+class _CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    content: bytes
+
+
+_CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class _ResponseCache:
+    """Least recently used store of cached GET responses, shared by all threads."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[_CacheKey, _CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _CacheKey) -> _CachedResponse | None:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+            return cached
+
+    def put(self, key: _CacheKey, cached: _CachedResponse, maxsize: int) -> None:
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: _CacheKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+_response_cache = _ResponseCache()
+
+
+def _request(
+    verb: str,
+    url: str,
+    json: JSON = None,
+    params: dict[str, str] | None = None,
+    headers: dict[str, str] | None = None,
+) -> tuple[requests.Response, JSON]:
     for i in range(10):
         try:
-            return _rate_limited_request(verb, url, json, params)
+            return _rate_limited_request(verb, url, json, params, headers)
         except RateLimitError:
             logger.debug("Pausing due to rate limit")
             time.sleep(1)
@@ -62,22 +131,31 @@ def _request(verb: str, url: str, json: JSON = None, params: dict[str, str] | No
     raise RequestError(requests.codes.too_many_requests, "Ratelimit exceeded and retry failed")
 
 
-def _rate_limited_request(verb: str, url: str, json: JSON = None, params: dict[str, str] | None = None) -> JSON:
-    logger.debug("%s: url=%s, params=%s, json=%s", verb.upper(), url, params, json)
+def _rate_limited_request(
+    verb: str,
+    url: str,
+    json: JSON = None,
+    params: dict[str, str] | None = None,
+    headers: dict[str, str] | None = None,
+) -> tuple[requests.Response, JSON]:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: url=%s, params=%s, json=%s", verb.upper(), url, params, json)
+    data = json_dumps(json) if json is not None else None
     response = api_config.client.request(
-        verb, url, timeout=api_config.request_timeout_seconds, json=json, params=params
+        verb, url, timeout=api_config.request_timeout_seconds, data=data, params=params, headers=headers
     )
-    if response.content and not response.headers.get("Content-Type", "").startswith("application/vnd.api+json"):
+    if response.content and not _JSONAPI_MEDIA_TYPE.match(response.headers.get("Content-Type", "")):
         raise RequestError(response.status_code, "Unsupported content type in server response.")
 
     try:
-        response_json = response.json()
-    except requests.exceptions.JSONDecodeError:
+        response_json = json_loads(response.content) if response.content else None
+    except ValueError:
         response_json = None
 
-    logger.debug("status_code=%s response=%s", response.status_code, response_json)
-    if "Server-Timing" in response.headers:
-        logger.debug("server-timing: %s", response.headers["Server-Timing"])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("status_code=%s response=%s", response.status_code, response_json)
+        if (server_timing := response.headers.get("Server-Timing")) is not None:
+            logger.debug("server-timing: %s", server_timing)
 
     if response.status_code == requests.codes.too_many_requests:
         raise RateLimitError()
@@ -85,20 +163,51 @@ def _rate_limited_request(verb: str, url: str, json: JSON = None, params: dict[s
     if not response.ok:
         raise JSONAPIRequestError.from_response(response.status_code, response_json)
 
+    return response, response_json
+
+
+def _cached_get(url: str, params: dict[str, str] | None) -> JSON:
+    """GET with conditional revalidation of previously seen responses.
+
+    The raw response body is cached rather than the parsed JSON, because deserialized models keep references into
+    the parsed dicts and may modify them.
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    cached = _response_cache.get(key)
+    headers: dict[str, str] = {}
+    if cached is not None:
+        if cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified is not None:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    response, response_json = _request("GET", url, params=params, headers=headers)
+    if response.status_code == requests.codes.not_modified and cached is not None:
+        logger.debug("not modified, using cached response")
+        return json_loads(cached.content)
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag is not None or last_modified is not None:
+        _response_cache.put(key, _CachedResponse(etag, last_modified, response.content), api_config.cache_size)
+    else:
+        _response_cache.discard(key)
     return response_json
 
 
 def get(url: str, params: dict[str, str] | None = None) -> JSON:
-    return _request("GET", url, params=params)
+    if api_config.cache_enabled:
+        return _cached_get(url, params)
+    return _request("GET", url, params=params)[1]
 
 
 def post(url: str, json: JSON) -> JSON:
-    return _request("POST", url, json=json)
+    return _request("POST", url, json=json)[1]
 
 
 def patch(url: str, json: JSON) -> JSON:
-    return _request("PATCH", url, json=json)
+    return _request("PATCH", url, json=json)[1]
 
 
 def delete(url: str, json: JSON) -> JSON:
-    return _request("DELETE", url, json=json)
+    return _request("DELETE", url, json=json)[1]
@@ -6,10 +6,10 @@
 import abc
 import warnings
 from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from itertools import islice
 from typing import Any, ClassVar, NamedTuple, Self
-from urllib.parse import urlparse
 
 from vilocify import JSON, api_config, http
 
@@ -18,6 +18,8 @@ Meta = JSONDict | None
 
 
 class Relationship[RelModel: "Model"](abc.ABC):
+    __slots__ = ("_relationship_name", "_target_type")
+
     def __init__(self, target_type: type[RelModel] | str, relationship_name: str | None = None):
         self._target_type = target_type
         self._relationship_name = relationship_name
@@ -40,6 +42,8 @@ class Relationship[RelModel: "Model"](abc.ABC):
 
 
 class RelationshipToOne[RelModel: "Model"](Relationship[RelModel]):
+    __slots__ = ()
+
     def default_relationship_name(self, target_type: type[RelModel]) -> str:
         return target_type.jsonapi_type_name()[:-1]
 
@@ -53,6 +57,8 @@ class RelationshipToOne[RelModel: "Model"](Relationship[RelModel]):
 
 
 class Many[RelModel: "Model"]:
+    __slots__ = ("obj", "relationship_name", "target_type")
+
     def __init__(self, obj: "Model", target_type: type[RelModel], relationship_name: str) -> None:
         self.obj = obj
         self.target_type = target_type
@@ -71,13 +77,20 @@ class Many[RelModel: "Model"]:
         Request(self.obj.__class__).replace_many_related(self.obj, self.relationship_name, *related)
 
     def iids(self) -> Iterator[str]:
-        yield from (m.id for m in self)
+        if self.obj.id is None:
+            raise UnmappedModelError("Model is not mapped")
+        related = Request(self.obj.__class__).iter_many_related(
+            self.obj.id, self.target_type, self.relationship_name, include=False
+        )
+        yield from (m.id for m in related if m.id is not None)
 
     def ids(self) -> list[str]:
         return list(self.iids())
 
 
 class RelationshipToMany[RelModel: "Model"](Relationship[RelModel]):
+    __slots__ = ()
+
     def default_relationship_name(self, target_type: type[RelModel]) -> str:
         return target_type.jsonapi_type_name()
 
@@ -94,15 +107,18 @@ class Action(Enum):
 
 
 class Attribute[T]:
+    __slots__ = ("api_attribute_name", "serialize")
+
     def __init__(self, api_attribute_name: str, serialize_on: tuple[Action, ...] = (Action.CREATE, Action.UPDATE)):
         self.api_attribute_name = api_attribute_name
         self.serialize = serialize_on
 
     def __get__[TModel: "Model"](self, obj: TModel, objtype: type[TModel] | None = None) -> T:
-        if self.api_attribute_name not in obj._jsonapi_attributes:
+        try:
+            return obj._jsonapi_attributes[self.api_attribute_name]
+        except KeyError:
             obj.refresh()
-
-        return obj._jsonapi_attributes[self.api_attribute_name]
+            return obj._jsonapi_attributes[self.api_attribute_name]
 
     def __set__[TModel: "Model"](self, obj: TModel, value: T):
         if self.serialize == ():
@@ -113,96 +129,96 @@ class Attribute[T]:
 
 
 class Serializer[TModel: "Model"]:
-    @staticmethod
-    def _get_data[T](api_response: JSON, data_type: type[T]) -> T | None:
-        if not isinstance(api_response, dict):
-            raise DeserializationError("Received invalid JSON:API response")
-
-        data = api_response.get("data")
-        if data is None:
-            return None
-
-        if not isinstance(data, data_type):
-            raise DeserializationError(f"Expected data to be {data_type.__name__}")
-
-        return data
-
     @staticmethod
     def deserialize_next_link(api_response: JSON) -> str | None:
-        if not isinstance(api_response, dict):
+        if type(api_response) is not dict:
             raise DeserializationError("Received invalid JSON:API response")
 
         links = api_response["links"]
-        if not isinstance(links, dict):
+        if type(links) is not dict:
             raise DeserializationError("Received invalid JSON:API response. links is not an object")
 
         next_link = links["next"]
-        if next_link is not None and not isinstance(next_link, str):
+        if next_link is not None and type(next_link) is not str:
             raise DeserializationError("Received invalid JSON:API response. The next link is not a string")
 
         return next_link
 
     @staticmethod
-    def deserialize_one(target_cls: type[TModel], api_response: JSON) -> TModel | None:
-        if api_response is None:
-            return None
-
-        if (data := Serializer._get_data(api_response, dict)) is None:
-            return None
-
-        if not isinstance(api_response, dict):
-            raise DeserializationError("Received invalid JSON:API response")
-
-        obj = target_cls()
-        obj._id = data["id"]
-
-        included = api_response.get("included", None)
-        if included is not None and not isinstance(included, list):
-            raise DeserializationError("Received invalid JSON:API response. `included` must be a list")
+    def _deserialize_resource(target_cls: type[TModel], data: dict, included_doc: JSON) -> TModel:
+        resource_id = data["id"]
 
         included_attributes: dict = {}
-        if included is not None and len(included) == 1:
-            included_doc = included[0]
+        if included_doc is not None:
             if (
-                isinstance(included_doc, dict)
-                and isinstance(included_doc["attributes"], dict)
-                and included_doc["id"] == obj._id
-                and included_doc["type"] == obj.jsonapi_type_name()
+                type(included_doc) is dict
+                and type(included_doc["attributes"]) is dict
+                and included_doc["id"] == resource_id
+                and included_doc["type"] == target_cls._jsonapi_type_name
             ):
                 included_attributes = included_doc["attributes"]
             else:
                 raise DeserializationError("Included document has wrong type or id")
 
+        # Bypass __init__, which would only set up empty state that is overwritten here
+        obj = target_cls.__new__(target_cls)
+        obj._id = resource_id
         obj._jsonapi_attributes = data.get("attributes", included_attributes)
+        obj._jsonapi_to_many_relationships = {}
+        obj._jsonapi_to_one_relationships = {}
 
         return obj
 
     @staticmethod
-    def deserialize_many(target_cls: type[TModel], api_response: JSON) -> Iterator[TModel]:
+    def deserialize_one(target_cls: type[TModel], api_response: JSON) -> TModel | None:
         if api_response is None:
             return None
 
-        if (data := Serializer._get_data(api_response, list)) is None:
+        if type(api_response) is not dict:
+            raise DeserializationError("Received invalid JSON:API response")
+
+        data = api_response.get("data")
+        if data is None:
+            return None
+
+        if type(data) is not dict:
+            raise DeserializationError("Expected data to be dict")
+
+        included = api_response.get("included", None)
+        if included is not None and type(included) is not list:
+            raise DeserializationError("Received invalid JSON:API response. `included` must be a list")
+
+        included_doc = included[0] if included is not None and len(included) == 1 else None
+        return Serializer._deserialize_resource(target_cls, data, included_doc)
+
+    @staticmethod
+    def deserialize_many(target_cls: type[TModel], api_response: JSON) -> Iterator[TModel]:
+        if api_response is None:
             return None
 
-        if not isinstance(api_response, dict):
+        if type(api_response) is not dict:
             raise DeserializationError("Received invalid JSON:API response")
 
+        data = api_response.get("data")
+        if data is None:
+            return None
+
+        if type(data) is not list:
+            raise DeserializationError("Expected data to be list")
+
         included_response = api_response.get("included", [])
 
-        if not isinstance(included_response, list):
+        if type(included_response) is not list:
             raise DeserializationError("Received invalid JSON:API response. Included response must be a list")
 
-        included = {(doc["type"], doc["id"]): doc for doc in included_response if isinstance(doc, dict)}
+        included = {(doc["type"], doc["id"]): doc for doc in included_response if type(doc) is dict}
 
         for item in data:
-            included_doc = included.get((item["type"], item["id"]))
-            one_data = {"data": item}
-            if included_doc is not None:
-                one_data["included"] = [included_doc]
-            deserialized_item = Serializer.deserialize_one(target_cls, one_data)
-            if deserialized_item is not None:
-                yield deserialized_item
+            if item is None:
+                continue
+            if type(item) is not dict:
+                raise DeserializationError("Expected data to be dict")
+            yield Serializer._deserialize_resource(target_cls, item, included.get((item["type"], item["id"])))
 
     @staticmethod
     def serialize_meta(meta: Meta) -> JSONDict:
@@ -219,26 +235,20 @@ class Serializer[TModel: "Model"]:
 
     @staticmethod
     def serialize_one(obj: "Model", meta: Meta, action: Action) -> JSON:
-        attrs = {
-            attr.api_attribute_name: obj._jsonapi_attributes[attr.api_attribute_name]
-            for name, attr in obj.__class__.__dict__.items()
-            if not name.startswith("_")
-            and isinstance(attr, Attribute)
-            and action in attr.serialize
-            and attr.api_attribute_name in obj._jsonapi_attributes
-        }
+        attributes = obj._jsonapi_attributes
+        attrs = {name: attributes[name] for name in obj._serialized_attribute_names[action] if name in attributes}
 
-        data: JSONDict = {"type": obj.jsonapi_type_name(), "attributes": attrs}
+        data: JSONDict = {"type": obj._jsonapi_type_name, "attributes": attrs}
 
         if obj.id:
             data["id"] = obj.id
 
         to_many_relationships: JSONDict = {
-            name: {"data": [{"id": item.id, "type": item.jsonapi_type_name()} for item in relationship_data]}
+            name: {"data": [{"id": item.id, "type": item._jsonapi_type_name} for item in relationship_data]}
             for name, relationship_data in obj._jsonapi_to_many_relationships.items()
         }
         to_one_relationships: JSONDict = {
-            name: {"data": {"id": item.id, "type": item.jsonapi_type_name()}}
+            name: {"data": {"id": item.id, "type": item._jsonapi_type_name}}
             for name, item in obj._jsonapi_to_one_relationships.items()
         }
 
@@ -258,7 +268,7 @@ class Serializer[TModel: "Model"]:
         for item in related:
             if item.id is None:
                 raise UnmappedModelError("Related model has no id")
-            data.append({"id": item.id, "type": item.jsonapi_type_name()})
+            data.append({"id": item.id, "type": item._jsonapi_type_name})
         return {"data": data}
 
 
@@ -275,14 +285,42 @@ class IllegalSortError(Exception):
 
 
 def urljoin(base: str, *path: str) -> str:
-    if urlparse(base).scheme not in ["http", "https"]:
-        raise ValueError("Bad schema in base")
-
+    # The base is api_config.base_url or api_config.api_host, whose scheme is validated when the base URL is set.
     segments = (segment.strip("/") for segment in path)
 
     return base.rstrip("/") + "/" + "/".join(segments)
 
 
+def _paginate[TModel: "Model"](
+    target_cls: type[TModel], url: str, params: dict[str, str], prefetch: bool
+) -> Iterator[TModel]:
+    """Iterate over all pages of a collection, following the next links.
+
+    With prefetch, the next page is requested in the background while the items of the current page are consumed.
+    Callers that stop after the first page, like Request.first(), should not prefetch.
+    """
+    response = http.get(url, params)
+    if response is None:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        while (next_url := Serializer.deserialize_next_link(response)) is not None:
+            next_page = urljoin(api_config.api_host, next_url)
+            if executor is None:
+                yield from Serializer.deserialize_many(target_cls, response)
+                response = http.get(next_page)
+            else:
+                future = executor.submit(http.get, next_page)
+                yield from Serializer.deserialize_many(target_cls, response)
+                response = future.result()
+
+        yield from Serializer.deserialize_many(target_cls, response)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
 class Filter(NamedTuple):
     attribute: str
     operator: str
@@ -300,21 +338,12 @@ class Request[TModel: "Model"]:
     def _inclusion_params[RelModel: "Model"](
         relationship_name: str, relationship_type: type[RelModel]
     ) -> dict[str, str]:
-        params = {"include": relationship_name}
-        fields = ",".join(relationship_type._jsonapi_attribute_names)
-        if fields:
-            params[f"fields[{relationship_type.jsonapi_type_name()}]"] = fields
-
-        return params
+        return {"include": relationship_name} | relationship_type._jsonapi_fields_params
 
     def get(self, resource_id: str) -> TModel:
-        jsonapi_type_name = self.model_class.jsonapi_type_name()
+        jsonapi_type_name = self.model_class._jsonapi_type_name
         url = urljoin(api_config.base_url, jsonapi_type_name, resource_id)
-        params = {}
-        fields = ",".join(self.model_class._jsonapi_attribute_names)
-        if fields:
-            params[f"fields[{jsonapi_type_name}]"] = fields
-
+        params = dict(self.model_class._jsonapi_fields_params)
         obj = Serializer.deserialize_one(self.model_class, http.get(url, params))
         if obj is None:
             raise UnmappedModelError(f"Cannot get resource {jsonapi_type_name} with id {resource_id}")
@@ -323,50 +352,54 @@ class Request[TModel: "Model"]:
     def get_one_related[RelModel: "Model"](
         self, resource_id: str, relationship_type: type[RelModel], relationship_name: str
     ) -> RelModel | None:
-        jsonapi_type_name = self.model_class.jsonapi_type_name()
+        jsonapi_type_name = self.model_class._jsonapi_type_name
         url = urljoin(api_config.base_url, jsonapi_type_name, resource_id, "relationships", relationship_name)
 
         params = self._inclusion_params(relationship_name, relationship_type)
         return Serializer.deserialize_one(relationship_type, http.get(url, params))
 
     def __iter__(self) -> Iterator[TModel]:
-        jsonapi_type_name = self.model_class.jsonapi_type_name()
-        url = urljoin(api_config.base_url, jsonapi_type_name)
+        return self._iter(self._page_size, prefetch=True)
+
+    def _iter(self, page_size: int, prefetch: bool = False, fields: dict[str, str] | None = None) -> Iterator[TModel]:
+        url = urljoin(api_config.base_url, self.model_class._jsonapi_type_name)
         params = {f"filter[{f.attribute}][{f.operator}]": f.value for f in self.filters}
-        params["page[size]"] = str(self._page_size)
-        fields = ",".join(self.model_class._jsonapi_attribute_names)
-        if fields:
-            params[f"fields[{jsonapi_type_name}]"] = fields
+        params["page[size]"] = str(page_size)
+        params |= self.model_class._jsonapi_fields_params if fields is None else fields
 
         if self.sorter:
             params["sort"] = self.sorter
 
-        response = http.get(url, params)
-        if response is None:
-            return None
-        yield from Serializer.deserialize_many(self.model_class, response)
-        while (next_url := Serializer.deserialize_next_link(response)) is not None:
-            response = http.get(urljoin(api_config.api_host, next_url))
-            yield from Serializer.deserialize_many(self.model_class, response)
+        yield from _paginate(self.model_class, url, params, prefetch)
 
     def all(self) -> list[TModel]:
         return list(self)
 
     def firstn(self, n: int) -> list[TModel]:
         """Return the first n elements of the query as a list"""
-        return list(islice(self, n))
+        return list(islice(self._iter(min(n, self._page_size)), n))
 
     def first(self) -> TModel | None:
         """Return the first element of the query or None."""
-        return next(iter(self), None)
+        return next(self._iter(1), None)
 
     def ipick(self, *attributes: str) -> Iterable[tuple[Any, ...]]:
-        # Primitive implementation using .__iter__().
-        # Could be optimized by making requests that restrict fields to given attributes
-        def make_tuple(o: TModel) -> tuple[Any, ...]:
-            return tuple(getattr(o, attribute) for attribute in attributes)
-
-        yield from (make_tuple(o) for o in self)
+        """Iterate over tuples of the given attributes, requesting only those attributes from the API."""
+        model_attributes = self.model_class._model_attributes
+        if any(attribute != "id" and attribute not in model_attributes for attribute in attributes):
+            # Anything but plain attributes, e.g. relationships, needs the full models
+            yield from (tuple(getattr(o, attribute) for attribute in attributes) for o in self)
+            return
+
+        api_names = [None if a == "id" else model_attributes[a].api_attribute_name for a in attributes]
+        fields = {
+            f"fields[{self.model_class._jsonapi_type_name}]": ",".join(
+                dict.fromkeys(name for name in api_names if name is not None)
+            )
+        }
+        for o in self._iter(self._page_size, prefetch=True, fields=fields):
+            values = o._jsonapi_attributes
+            yield tuple(o.id if name is None else values.get(name) for name in api_names)
 
     def pick(self, *attributes: str) -> list[tuple[Any, ...]]:
         return list(self.ipick(*attributes))
@@ -378,20 +411,18 @@ class Request[TModel: "Model"]:
         return list(self.iids())
 
     def iter_many_related[RelModel: "Model"](
-        self, resource_id: str, relationship_type: type[RelModel], relationship_name: str
+        self, resource_id: str, relationship_type: type[RelModel], relationship_name: str, include: bool = True
     ) -> Iterable[RelModel]:
+        """Iterate over related models.
+
+        Without include, only the resource linkage is requested and the yielded models carry nothing but their id.
+        """
         url = urljoin(
-            api_config.base_url, self.model_class.jsonapi_type_name(), resource_id, "relationships", relationship_name
+            api_config.base_url, self.model_class._jsonapi_type_name, resource_id, "relationships", relationship_name
         )
-        params = self._inclusion_params(relationship_name, relationship_type)
+        params = self._inclusion_params(relationship_name, relationship_type) if include else {}
         params["page[size]"] = str(self._page_size)
-        response = http.get(url, params)
-        if response is None:
-            return None
-        yield from Serializer.deserialize_many(relationship_type, response)
-        while (next_url := Serializer.deserialize_next_link(response)) is not None:
-            response = http.get(urljoin(api_config.api_host, next_url))
-            yield from Serializer.deserialize_many(relationship_type, response)
+        yield from _paginate(relationship_type, url, params, prefetch=True)
 
     def where(self, attribute: str, operator: str, value: str | list[str]) -> "Request[TModel]":
         if isinstance(value, list):
@@ -420,7 +451,7 @@ class Request[TModel: "Model"]:
         return self
 
     def create(self, obj: TModel, meta: Meta = None):
-        url = urljoin(api_config.base_url, self.model_class.jsonapi_type_name())
+        url = urljoin(api_config.base_url, self.model_class._jsonapi_type_name)
         response = http.post(url, json=Serializer.serialize_one(obj, meta, Action.CREATE))
         res = Serializer.deserialize_one(self.model_class, response)
         if res is not None:
@@ -430,7 +461,7 @@ class Request[TModel: "Model"]:
     def update(self, obj: TModel, meta: Meta = None):
         if obj.id is None:
             raise UnmappedModelError("Model is unmapped and has no ID")
-        url = urljoin(api_config.base_url, self.model_class.jsonapi_type_name(), obj.id)
+        url = urljoin(api_config.base_url, self.model_class._jsonapi_type_name, obj.id)
         response = http.patch(url, json=Serializer.serialize_one(obj, meta, Action.UPDATE))
         res = Serializer.deserialize_one(self.model_class, response)
         if res is not None:
@@ -443,7 +474,7 @@ class Request[TModel: "Model"]:
         if obj.id is None:
             raise UnmappedModelError("Model is unmapped and has no ID")
         url = urljoin(
-            api_config.base_url, self.model_class.jsonapi_type_name(), obj.id, "relationships", relationship_name
+            api_config.base_url, self.model_class._jsonapi_type_name, obj.id, "relationships", relationship_name
         )
         method(url, Serializer.serialize_many_related(*related))
 
@@ -459,7 +490,7 @@ class Request[TModel: "Model"]:
     def delete(self, obj: TModel, meta: Meta = None):
         if obj.id is None:
             raise UnmappedModelError("Model is unmapped and has no ID")
-        url = urljoin(api_config.base_url, self.model_class.jsonapi_type_name(), obj.id)
+        url = urljoin(api_config.base_url, self.model_class._jsonapi_type_name, obj.id)
         http.delete(url, Serializer.serialize_meta(meta))
 
 
@@ -468,14 +499,34 @@ class ModelMeta(type):
 
     def __init__(cls, name: str, bases: tuple[type, ...], attrs: dict[str, Any]):
         super().__init__(name, bases, attrs)
-        cls._jsonapi_attribute_names = [attr.api_attribute_name for attr in attrs.values() if type(attr) is Attribute]
-        cls._model_attribute_names = [name for name, attr in attrs.items() if type(attr) is Attribute]
+        cls._jsonapi_type_name = cls.jsonapi_type_name()  # type: ignore[attr-defined]
+        cls._model_attributes = {name: attr for name, attr in attrs.items() if type(attr) is Attribute}
+        cls._jsonapi_attribute_names = [attr.api_attribute_name for attr in cls._model_attributes.values()]
+        # Sparse fieldset parameter restricting responses to the attributes the model knows about
+        cls._jsonapi_fields_params = (
+            {f"fields[{cls._jsonapi_type_name}]": ",".join(cls._jsonapi_attribute_names)}
+            if cls._jsonapi_attribute_names
+            else {}
+        )
+        cls._serialized_attribute_names = {
+            action: tuple(
+                attr.api_attribute_name
+                for name, attr in attrs.items()
+                if not name.startswith("_") and isinstance(attr, Attribute) and action in attr.serialize
+            )
+            for action in Action
+        }
         ModelMeta.__models__[cls.__name__] = cls
 
 
 class Model[TModel: "Model"](metaclass=ModelMeta):
-    _model_attribute_names: ClassVar[list[str]]
+    __slots__ = ("_id", "_jsonapi_attributes", "_jsonapi_to_many_relationships", "_jsonapi_to_one_relationships")
+
+    _jsonapi_type_name: ClassVar[str]
+    _model_attributes: ClassVar[dict[str, Attribute]]
     _jsonapi_attribute_names: ClassVar[list[str]]
+    _jsonapi_fields_params: ClassVar[dict[str, str]]
+    _serialized_attribute_names: ClassVar[dict[Action, tuple[str, ...]]]
 
     def __init__(self, **kwargs: str | int | list | dict | None):
         self._id = None
@@ -485,9 +536,9 @@ class Model[TModel: "Model"](metaclass=ModelMeta):
         kwargs.pop("type", None)
         self._jsonapi_attributes: dict[str, Any] = {}
         for arg, value in kwargs.items():
-            if arg not in self._model_attribute_names:
+            if (attribute := self._model_attributes.get(arg)) is None:
                 raise AttributeError(f"{type(self)} has no attribute {arg}")
-            setattr(self, arg, value)
+            attribute.__set__(self, value)
         self._jsonapi_to_many_relationships: dict[str, Iterable[TModel]] = {}
         self._jsonapi_to_one_relationships: dict[str, TModel] = {}
 
@@ -544,9 +595,9 @@ class Model[TModel: "Model"](metaclass=ModelMeta):
     def __eq__(self, other: object) -> bool:
         return (
             isinstance(other, Model)
+            and type(self) is type(other)
             and self._id == other._id
-            and self.jsonapi_type_name() == other.jsonapi_type_name()
-            and all(getattr(self, name) == getattr(other, name) for name in self._model_attribute_names)
+            and self._jsonapi_attributes == other._jsonapi_attributes
         )
 
     # Models are mutable. From object.__hash__ docs: "If a class defines mutable objects and implements an __eq__()
@@ -556,7 +607,7 @@ class Model[TModel: "Model"](metaclass=ModelMeta):
     def __repr__(self) -> str:
         cutoff = 3
 
-        attributes = ", ".join((f"{k!r}: {v!r}" for k, v in list(self._jsonapi_attributes.items())[:cutoff]))
+        attributes = ", ".join(f"{k!r}: {v!r}" for k, v in islice(self._jsonapi_attributes.items(), cutoff))
         if len(self._jsonapi_attributes) > cutoff:
             attributes = attributes + ", ..."
 
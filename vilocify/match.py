@@ -8,6 +8,7 @@ versions that can be used to identify components in Vilocify's component databas
 #  SPDX-FileCopyrightText: 2026 Siemens AG
 #  SPDX-License-Identifier: MIT
 
+from collections.abc import Callable
 from typing import NamedTuple
 
 from cyclonedx.model.bom import Component as BomComponent
@@ -128,29 +129,53 @@ class MissingPurlError(Exception):
     """Raised when importing an SBOM component that has no PURL"""
 
 
-def _match_purl_distro(purl: PackageURL) -> Matcher:
-    distro_type = PURL_DISTROS.get(purl.type.lower())
-    if distro_type is None:
-        return Matcher()
+# PURL_DISTROS flattened for lookup by (type, namespace): the default component prefix and the distro qualifier
+# prefixes, longest first so that e.g. "amzn-2023" wins over "amzn-2".
+_DISTRO_PREFIXES: dict[tuple[str, str], tuple[str, list[tuple[str, str]]]] = {
+    (purl_type, namespace): (
+        prefixes[None],
+        sorted(((q, p) for q, p in prefixes.items() if q is not None), key=lambda qp: len(qp[0]), reverse=True),
+    )
+    for purl_type, namespaces in PURL_DISTROS.items()
+    for namespace, prefixes in namespaces.items()
+}
+
+# Exact distro qualifiers, which cover the common case without scanning the prefixes
+_DISTRO_QUALIFIERS: dict[tuple[str, str, str], str] = {
+    (purl_type, namespace, qualifier): prefix
+    for purl_type, namespaces in PURL_DISTROS.items()
+    for namespace, prefixes in namespaces.items()
+    for qualifier, prefix in prefixes.items()
+    if qualifier is not None
+}
+
 
+def _match_purl_distro(purl: PackageURL) -> Matcher:
     if purl.namespace is None:
         return Matcher()
 
-    distro_namespace = distro_type.get(purl.namespace.lower())
-    if distro_namespace is None:
+    # PackageURL already lowercases the type, but namespace and qualifiers keep their case
+    purl_type = purl.type
+    namespace = purl.namespace.lower()
+    distro = _DISTRO_PREFIXES.get((purl_type, namespace))
+    if distro is None:
         return Matcher()
 
+    default_prefix, qualifier_prefixes = distro
     qualifier = None
     if isinstance(purl.qualifiers, dict):
         qualifier = purl.qualifiers.get("distro")
+
+    component_prefix = default_prefix
     if isinstance(qualifier, str):
         qualifier = qualifier.lower()
+        exact = _DISTRO_QUALIFIERS.get((purl_type, namespace, qualifier))
+        if exact is not None:
+            component_prefix = exact
+        else:
+            component_prefix = next((p for q, p in qualifier_prefixes if qualifier.startswith(q)), default_prefix)
 
-    for matcher, component_prefix in distro_namespace.items():
-        if matcher is not None and qualifier is not None and qualifier.startswith(matcher):
-            return Matcher(f"{component_prefix}: {purl.name}", "All Versions")
-
-    return Matcher(f"{distro_namespace[None]}: {purl.name}", "All Versions")
+    return Matcher(f"{component_prefix}: {purl.name}", "All Versions")
 
 
 def _match_purl_type(purl: PackageURL) -> Matcher:
@@ -160,14 +185,23 @@ def _match_purl_type(purl: PackageURL) -> Matcher:
     return Matcher(f"{PURL_TYPES[purl.type]}: {purl.namespace + '/' if purl.namespace else ''}{purl.name}", version)
 
 
-def match_purl(purl: PackageURL) -> Matcher:
-    if purl.type == "github":
-        return Matcher(None, purl.version, f"https://github.com/{purl.namespace}/{purl.name}")
+def _match_purl_github(purl: PackageURL) -> Matcher:
+    return Matcher(None, purl.version, f"https://github.com/{purl.namespace}/{purl.name}")
+
+
+def _match_purl_unknown(purl: PackageURL) -> Matcher:
+    return Matcher()
 
-    if purl.type in PURL_TYPES:
-        return _match_purl_type(purl)
 
-    return _match_purl_distro(purl)
+_PURL_MATCHERS: dict[str, Callable[[PackageURL], Matcher]] = {
+    "github": _match_purl_github,
+    **dict.fromkeys(PURL_TYPES, _match_purl_type),
+    **dict.fromkeys(PURL_DISTROS, _match_purl_distro),
+}
+
+
+def match_purl(purl: PackageURL) -> Matcher:
+    return _PURL_MATCHERS.get(purl.type, _match_purl_unknown)(purl)
 
 
 def match_bom_component(bom_component: BomComponent) -> Matcher:
@@ -7,6 +7,8 @@ from vilocify.jsonapy import Action, Attribute, Model, RelationshipToMany, Relat
 
 
 class Component(Model):
+    __slots__ = ()
+
     vendor = Attribute[str | None]("vendor")
     name = Attribute[str | None]("name")
     version = Attribute[str | None]("version")
@@ -24,6 +26,8 @@ class Component(Model):
 
 
 class Membership(Model):
+    __slots__ = ()
+
     username = Attribute[str]("userName", serialize_on=(Action.CREATE,))
     email = Attribute[str]("userEmail", serialize_on=(Action.CREATE,))
     role = Attribute[str]("role", serialize_on=(Action.CREATE,))
@@ -34,6 +38,8 @@ class Membership(Model):
 
 
 class ComponentRequest(Model):
+    __slots__ = ()
+
     vendor = Attribute[str | None]("vendor")
     name = Attribute[str]("name")
     version = Attribute[str]("version")
@@ -51,6 +57,8 @@ class ComponentRequest(Model):
 
 
 class Vulnerability(Model):
+    __slots__ = ()
+
     @classmethod
     def jsonapi_type_name(cls) -> str:
         return "vulnerabilities"
@@ -65,6 +73,8 @@ class Vulnerability(Model):
 
 
 class Notification(Model):
+    __slots__ = ()
+
     title = Attribute[str]("title")
     priority = Attribute[str]("priority")
     action = Attribute[str]("action")
@@ -87,6 +97,8 @@ class Notification(Model):
 
 
 class MonitoringList(Model):
+    __slots__ = ()
+
     MAX_COMPONENTS = 2000
 
     name = Attribute[str]("name")
@@ -103,6 +115,8 @@ class MonitoringList(Model):
 
 
 class Subscription(Model):
+    __slots__ = ()
+
     role = Attribute[str]("role")
     priorities = Attribute[list[str]]("priorities")
     created_at = Attribute[str]("createdAt", serialize_on=())